@@ -82,7 +82,7 @@ async def run_helm_deploy(
 
     return DeployProcess(
         name=field_set.address.spec,
-        publish_dependencies=tuple(publish_targets),
+        publish_dependencies=frozenset(publish_targets),
         process=interactive_process,
     )
 
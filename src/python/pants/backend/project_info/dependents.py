@@ -1,9 +1,10 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from enum import Enum
+from itertools import chain
 from typing import Iterable, Set
 
 from pants.engine.addresses import Address, Addresses
@@ -22,6 +23,8 @@ from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 
+_EMPTY: FrozenOrderedSet[Address] = FrozenOrderedSet()
+
 
 @dataclass(frozen=True)
 class AddressToDependents:
@@ -39,8 +42,21 @@ class DependentsOutputFormat(Enum):
     json = "json"
 
 
-@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
-async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+@dataclass(frozen=True)
+class AddressToDependencies:
+    """The resolved dependencies of every target.
+
+    This acts as the fingerprint of the dependency graph: when it compares equal to the value from a
+    previous run, the engine does not need to recompute the `AddressToDependents` derived from it.
+    """
+
+    mapping: FrozenDict[Address, Addresses]
+
+
+@rule(desc="Map all targets to their dependencies", level=LogLevel.DEBUG)
+async def map_addresses_to_dependencies(
+    all_targets: AllUnexpandedTargets,
+) -> AddressToDependencies:
     dependencies_per_target = await MultiGet(
         Get(
             Addresses,
@@ -50,18 +66,34 @@ async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> Addr
         )
         for tgt in all_targets
     )
+    return AddressToDependencies(
+        FrozenDict(zip((tgt.address for tgt in all_targets), dependencies_per_target))
+    )
 
-    address_to_dependents = defaultdict(set)
-    for tgt, dependencies in zip(all_targets, dependencies_per_target):
+
+@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
+def map_addresses_to_dependents(
+    address_to_dependencies: AddressToDependencies,
+) -> AddressToDependents:
+    # NB: Each address appears once in the mapping, so the lists cannot contain duplicates.
+    address_to_dependents = defaultdict(list)
+    for address, dependencies in address_to_dependencies.mapping.items():
         for dependency in dependencies:
-            address_to_dependents[dependency].add(tgt.address)
+            address_to_dependents[dependency].append(address)
+
+    # Most addresses have only a few dependents, and many have exactly the same ones (e.g. generated
+    # targets, which all have their generator as a dependent), so share one instance of each set.
+    interned: dict[tuple[Address, ...], FrozenOrderedSet[Address]] = {}
+
+    def intern(dependents: list[Address]) -> FrozenOrderedSet[Address]:
+        key = tuple(dependents)
+        result = interned.get(key)
+        if result is None:
+            result = interned[key] = FrozenOrderedSet(key)
+        return result
+
     return AddressToDependents(
-        FrozenDict(
-            {
-                addr: FrozenOrderedSet(dependents)
-                for addr, dependents in address_to_dependents.items()
-            }
-        )
+        FrozenDict({addr: intern(dependents) for addr, dependents in address_to_dependents.items()})
     )
 
 
@@ -87,22 +119,77 @@ class Dependents(DeduplicatedCollection[Address]):
 def find_dependents(
     request: DependentsRequest, address_to_dependents: AddressToDependents
 ) -> Dependents:
-    check = set(request.addresses)
-    known_dependents: Set[Address] = set()
-    while True:
-        dependents = set(known_dependents)
-        for target in check:
-            target_dependents = address_to_dependents.mapping.get(target, FrozenOrderedSet())
-            dependents.update(target_dependents)
-        check = dependents - known_dependents
-        if not check or not request.transitive:
-            result = (
-                dependents | set(request.addresses)
-                if request.include_roots
-                else dependents - set(request.addresses)
-            )
-            return Dependents(result)
-        known_dependents = dependents
+    roots = set(request.addresses)
+    dependents: Set[Address] = set()
+    if not request.transitive:
+        dependents.update(
+            *(address_to_dependents.mapping.get(address, _EMPTY) for address in roots)
+        )
+    else:
+        # Each address is enqueued at most once, so every edge is traversed at most once. The roots
+        # are expanded up front, and so are never re-enqueued.
+        frontier = deque(roots)
+        while frontier:
+            for dependent in address_to_dependents.mapping.get(frontier.popleft(), _EMPTY):
+                if dependent not in dependents:
+                    dependents.add(dependent)
+                    if dependent not in roots:
+                        frontier.append(dependent)
+    result = dependents | roots if request.include_roots else dependents - roots
+    return Dependents(result)
+
+
+@dataclass(frozen=True)
+class DependentsPerAddress:
+    """The dependents of each requested address, in no particular order."""
+
+    mapping: FrozenDict[Address, FrozenOrderedSet[Address]]
+
+
+@rule(level=LogLevel.DEBUG)
+def find_dependents_per_address(
+    request: DependentsRequest, address_to_dependents: AddressToDependents
+) -> DependentsPerAddress:
+    """Find the dependents of each requested address separately.
+
+    Rather than traversing the graph once per root, a single traversal tags every reached address
+    with a bitmask of the roots that it was reached from.
+    """
+    dependents_per_root: list[set[Address]]
+    if request.transitive:
+        reached = {root: 1 << i for i, root in enumerate(request.addresses)}
+        frontier = deque(request.addresses)
+        while frontier:
+            address = frontier.popleft()
+            mask = reached[address]
+            for dependent in address_to_dependents.mapping.get(address, _EMPTY):
+                previous = reached.get(dependent, 0)
+                if previous | mask != previous:
+                    reached[dependent] = previous | mask
+                    frontier.append(dependent)
+
+        dependents_per_root = [set() for _ in request.addresses]
+        for address, mask in reached.items():
+            while mask:
+                lowest_bit = mask & -mask
+                dependents_per_root[lowest_bit.bit_length() - 1].add(address)
+                mask ^= lowest_bit
+    else:
+        dependents_per_root = [
+            set(address_to_dependents.mapping.get(root, _EMPTY)) for root in request.addresses
+        ]
+
+    for root, dependents in zip(request.addresses, dependents_per_root):
+        if request.include_roots:
+            dependents.add(root)
+        else:
+            dependents.discard(root)
+    return DependentsPerAddress(
+        FrozenDict(
+            (root, FrozenOrderedSet(dependents))
+            for root, dependents in zip(request.addresses, dependents_per_root)
+        )
+    )
 
 
 class DependentsSubsystem(LineOriented, GoalSubsystem):
@@ -151,24 +238,30 @@ async def list_dependents_as_json(
     addresses: Addresses, dependents_subsystem: DependentsSubsystem, console: Console
 ) -> None:
     """Get dependents for given addresses and list them in the console in JSON."""
-    dependents_group = await MultiGet(
-        Get(
-            Dependents,
-            DependentsRequest(
-                (address,),
-                transitive=dependents_subsystem.transitive,
-                include_roots=dependents_subsystem.closed,
-            ),
-        )
-        for address in addresses
+    dependents_per_address = await Get(
+        DependentsPerAddress,
+        DependentsRequest(
+            addresses,
+            transitive=dependents_subsystem.transitive,
+            include_roots=dependents_subsystem.closed,
+        ),
     )
-    iterated_addresses = []
-    for dependents in dependents_group:
-        iterated_addresses.append(sorted([str(address) for address in dependents]))
-    mapping = dict(zip([str(address) for address in addresses], iterated_addresses))
-    output = json.dumps(mapping, indent=4)
-    with dependents_subsystem.line_oriented(console) as print_stdout:
-        print_stdout(output)
+    # The same targets are often dependents of many of the roots, so render each address only once.
+    mapping = dependents_per_address.mapping
+    address_strs = {address: str(address) for address in set(chain(mapping, *mapping.values()))}
+
+    # Stream the mapping `{target: [dependents]}` one target at a time, rather than rendering the
+    # whole document in memory. The result is identical to `json.dumps(mapping, indent=4)`.
+    sep = dependents_subsystem.unescaped_sep()
+    with dependents_subsystem.output(console) as write_stdout:
+        write_stdout("{")
+        for i, (address, dependents) in enumerate(mapping.items()):
+            dependents_json = json.dumps(sorted(address_strs[d] for d in dependents), indent=4)
+            write_stdout(
+                f"{',' if i else ''}\n    {json.dumps(address_strs[address])}: "
+                + dependents_json.replace("\n", "\n    ")
+            )
+        write_stdout(("\n}" if mapping else "}") + sep)
 
 
 @goal_rule
@@ -243,3 +243,28 @@ def test_dependents_as_json_transitive_deps(rule_runner: RuleRunner) -> None:
             "special:special": ["special:special"],
         },
     )
+
+
+def test_dependents_as_json_shared_dependents(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "cycle1/BUILD": "tgt(dependencies=['cycle2', 'base'])",
+            "cycle2/BUILD": "tgt(dependencies=['cycle1'])",
+        }
+    )
+    assert_dependents(
+        rule_runner,
+        targets=["base", "cycle1", "leaf"],
+        transitive=True,
+        output_format=DependentsOutputFormat.json,
+        expected={
+            "base:base": [
+                "cycle1:cycle1",
+                "cycle2:cycle2",
+                "intermediate:intermediate",
+                "leaf:leaf",
+            ],
+            "cycle1:cycle1": ["cycle2:cycle2"],
+            "leaf:leaf": [],
+        },
+    )
@@ -6,7 +6,8 @@ from __future__ import annotations
 import json
 from collections import deque
 from dataclasses import dataclass
-from typing import Iterable
+from itertools import chain
+from typing import Iterable, Optional, Sequence, Tuple
 
 from pants.base.specs import Specs
 from pants.base.specs_parser import SpecsParser
@@ -24,6 +25,7 @@ from pants.engine.target import (
     TransitiveTargetsRequest,
 )
 from pants.option.option_types import StrOption
+from pants.util.frozendict import FrozenDict
 
 
 class PathsSubsystem(Outputting, GoalSubsystem):
@@ -49,11 +51,28 @@ class PathsGoal(Goal):
     environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
 
 
+# A path as a linked list of `(last_target, rest_of_path)`, so that paths sharing a prefix share
+# its storage.
+_LinkedPath = Tuple[int, Optional["_LinkedPath"]]
+
+
+def _unlink_path(path: _LinkedPath) -> list[int]:
+    target, rest = path
+    targets = [target]
+    while rest is not None:
+        target, rest = rest
+        targets.append(target)
+    targets.reverse()
+    return targets
+
+
 def find_paths_breadth_first(
-    adjacency_lists: dict[Address, Targets], from_target: Address, to_target: Address
-) -> Iterable[list[Address]]:
+    adjacency_lists: Sequence[Sequence[int]], from_target: int, to_target: int
+) -> Iterable[list[int]]:
     """Yields the paths between from_target to to_target if they exist.
 
+    Targets are identified by their index into `adjacency_lists`.
+
     The paths are returned ordered by length, shortest first. If there are cycles, it checks visited
     edges to prevent recrossing them.
     """
@@ -62,24 +81,24 @@ def find_paths_breadth_first(
         yield [from_target]
         return
 
-    visited_edges = set()
-    to_walk_paths = deque([[from_target]])
+    # Edges are encoded as `prev_target * num_targets + target`, with `num_targets` standing in for
+    # the missing predecessor of `from_target`.
+    num_targets = len(adjacency_lists)
+    visited_edges: set[int] = set()
+    to_walk_paths: deque[_LinkedPath] = deque([(from_target, None)])
 
     while len(to_walk_paths) > 0:
         cur_path = to_walk_paths.popleft()
-        target = cur_path[-1]
+        target, prev_path = cur_path
 
-        if len(cur_path) > 1:
-            prev_target: Address | None = cur_path[-2]
-        else:
-            prev_target = None
-        current_edge = (prev_target, target)
+        prev_target = prev_path[0] if prev_path is not None else num_targets
+        current_edge = prev_target * num_targets + target
 
         if current_edge not in visited_edges:
-            for dep in adjacency_lists.get(target, []):
-                dep_path = cur_path + [dep.address]
-                if dep.address == to_target:
-                    yield dep_path
+            for dep in adjacency_lists[target]:
+                dep_path = (dep, cur_path)
+                if dep == to_target:
+                    yield _unlink_path(dep_path)
                 else:
                     to_walk_paths.append(dep_path)
             visited_edges.add(current_edge)
@@ -96,23 +115,47 @@ class SpecsPathsCollection:
 
 
 @dataclass(frozen=True)
-class RootDestinationPair:
+class RootDestinationsPair:
     root: Target
-    destination: Target
+    destinations: Targets
 
 
 @dataclass(frozen=True)
-class RootDestinationsPair:
-    root: Target
-    destinations: Targets
+class AdjacencyLists:
+    """The dependency graph of the transitive closure of a root.
+
+    Targets are identified by their index into `addresses`.
+    """
+
+    addresses: tuple[Address, ...]
+    ids: FrozenDict[Address, int]
+    adjacency_lists: tuple[tuple[int, ...], ...]
+
+    def find_spec_paths(self, from_address: Address, to_address: Address) -> SpecsPaths:
+        to_id = self.ids.get(to_address)
+        if to_id is None:
+            return SpecsPaths(paths=[])
+        return SpecsPaths(
+            paths=[
+                [self.addresses[i].spec for i in path]
+                for path in find_paths_breadth_first(
+                    self.adjacency_lists, self.ids[from_address], to_id
+                )
+            ]
+        )
 
 
-@rule(desc="Get paths between root and destination.")
-async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> SpecsPaths:
+@dataclass(frozen=True)
+class AdjacencyListsRequest:
+    root: Address
+
+
+@rule(desc="Get the dependency graph of a root.")
+async def get_adjacency_lists(request: AdjacencyListsRequest) -> AdjacencyLists:
     transitive_targets = await Get(
         TransitiveTargets,
         TransitiveTargetsRequest(
-            [pair.root.address], should_traverse_deps_predicate=AlwaysTraverseDeps()
+            [request.root], should_traverse_deps_predicate=AlwaysTraverseDeps()
         ),
     )
 
@@ -126,32 +169,42 @@ async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> S
         for tgt in transitive_targets.closure
     )
 
-    transitive_targets_closure_addresses = (t.address for t in transitive_targets.closure)
-    adjacency_lists = dict(zip(transitive_targets_closure_addresses, adjacent_targets_per_target))
-
-    spec_paths = []
-    for path in find_paths_breadth_first(
-        adjacency_lists, pair.root.address, pair.destination.address
+    # Dependencies may fall outside of the closure (e.g. when transitively excluded with `!!`), in
+    # which case they are still identified, but as targets without any dependencies of their own.
+    ids: dict[Address, int] = {}
+    for address in chain(
+        (tgt.address for tgt in transitive_targets.closure),
+        (
+            dep.address
+            for adjacent_targets in adjacent_targets_per_target
+            for dep in adjacent_targets
+        ),
     ):
-        spec_path = [address.spec for address in path]
-        spec_paths.append(spec_path)
+        ids.setdefault(address, len(ids))
 
-    return SpecsPaths(paths=spec_paths)
+    adjacency_lists = tuple(
+        tuple(ids[dep.address] for dep in adjacent_targets)
+        for adjacent_targets in adjacent_targets_per_target
+    )
+    return AdjacencyLists(
+        addresses=tuple(ids),
+        ids=FrozenDict(ids),
+        adjacency_lists=adjacency_lists + ((),) * (len(ids) - len(adjacency_lists)),
+    )
 
 
 @rule("Get paths between root and multiple destinations.")
 async def get_paths_between_root_and_destinations(
     pair: RootDestinationsPair,
 ) -> SpecsPathsCollection:
-    spec_paths = await MultiGet(
-        Get(
-            SpecsPaths,
-            RootDestinationPair,
-            RootDestinationPair(destination=destination, root=pair.root),
-        )
-        for destination in pair.destinations
+    # The dependency graph of the root is shared by all of the destinations, so build it once.
+    adjacency_lists = await Get(AdjacencyLists, AdjacencyListsRequest(pair.root.address))
+    return SpecsPathsCollection(
+        spec_paths=[
+            adjacency_lists.find_spec_paths(pair.root.address, destination.address)
+            for destination in pair.destinations
+        ]
     )
-    return SpecsPathsCollection(spec_paths=list(spec_paths))
 
 
 @goal_rule
@@ -166,27 +219,20 @@ async def paths(console: Console, paths_subsystem: PathsSubsystem) -> PathsGoal:
         raise ValueError("Must set --to")
 
     specs_parser = SpecsParser()
+    from_specs = specs_parser.parse_specs(
+        [path_from],
+        description_of_origin="the option `--paths-from`",
+    )
+    to_specs = specs_parser.parse_specs(
+        [path_to],
+        description_of_origin="the option `--paths-to`",
+    )
 
     from_tgts, to_tgts = await MultiGet(
-        Get(
-            Targets,
-            Specs,
-            specs_parser.parse_specs(
-                [path_from],
-                description_of_origin="the option `--paths-from`",
-            ),
-        ),
-        Get(
-            Targets,
-            Specs,
-            specs_parser.parse_specs(
-                [path_to],
-                description_of_origin="the option `--paths-to`",
-            ),
-        ),
+        Get(Targets, Specs, from_specs),
+        Get(Targets, Specs, to_specs),
     )
 
-    all_spec_paths = []
     spec_paths = await MultiGet(
         Get(
             SpecsPathsCollection,
@@ -195,10 +241,9 @@ async def paths(console: Console, paths_subsystem: PathsSubsystem) -> PathsGoal:
         )
         for root in from_tgts
     )
-
-    for spec_path in spec_paths:
-        for path in (p.paths for p in spec_path.spec_paths):
-            all_spec_paths.extend(path)
+    all_spec_paths = list(
+        chain.from_iterable(p.paths for spec_path in spec_paths for p in spec_path.spec_paths)
+    )
 
     with paths_subsystem.output(console) as write_stdout:
         write_stdout(json.dumps(all_spec_paths, indent=2) + "\n")
@@ -204,3 +204,14 @@ def test_excluded_paths(rule_runner: RuleRunner) -> None:
         path_to="src/prj/b",
         expected=[],
     )
+
+
+def test_paths_through_excluded_dependencies(rule_runner: RuleRunner) -> None:
+    # `3rdparty#lib-pluginA` is transitively excluded from `src/prj/a`, but is still a dependency
+    # of `3rdparty#lib`, so the dependency graph of the root reaches outside of its closure.
+    assert_paths(
+        rule_runner,
+        path_from="src/prj/a",
+        path_to="3rdparty#lib-pluginB",
+        expected=[["src/prj/a:a", "3rdparty#lib", "3rdparty#lib-pluginB"]],
+    )
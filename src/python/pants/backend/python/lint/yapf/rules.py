@@ -14,7 +14,7 @@ from pants.backend.python.util_rules.pex import PexRequest, VenvPex, VenvPexProc
 from pants.core.goals.fmt import AbstractFmtRequest, FmtResult, FmtTargetsRequest
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
 from pants.core.util_rules.partitions import PartitionerType
-from pants.engine.fs import Digest, MergeDigests
+from pants.engine.fs import EMPTY_DIGEST, Digest, MergeDigests, Snapshot
 from pants.engine.process import ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import FieldSet, Target
@@ -39,21 +39,27 @@ class YapfRequest(FmtTargetsRequest):
     partitioner_type = PartitionerType.DEFAULT_SINGLE_PARTITION
 
 
+async def _get_input_digest(snapshot: Snapshot, yapf: Yapf) -> Digest:
+    config_files = await Get(ConfigFiles, ConfigFilesRequest, yapf.config_request(snapshot.dirs))
+    if config_files.snapshot.digest == EMPTY_DIGEST:
+        return snapshot.digest
+    return await Get(Digest, MergeDigests((snapshot.digest, config_files.snapshot.digest)))
+
+
 async def _run_yapf(
     request: AbstractFmtRequest.Batch,
     yapf: Yapf,
     interpreter_constraints: InterpreterConstraints | None = None,
 ) -> FmtResult:
-    yapf_pex_get = Get(
-        VenvPex, PexRequest, yapf.to_pex_request(interpreter_constraints=interpreter_constraints)
-    )
-    config_files_get = Get(
-        ConfigFiles, ConfigFilesRequest, yapf.config_request(request.snapshot.dirs)
-    )
-    yapf_pex, config_files = await MultiGet(yapf_pex_get, config_files_get)
-
-    input_digest = await Get(
-        Digest, MergeDigests((request.snapshot.digest, config_files.snapshot.digest))
+    # NB: The input digest does not depend on the yapf PEX, so it is built concurrently with the
+    # (slower) PEX.
+    yapf_pex, input_digest = await MultiGet(
+        Get(
+            VenvPex,
+            PexRequest,
+            yapf.to_pex_request(interpreter_constraints=interpreter_constraints),
+        ),
+        _get_input_digest(request.snapshot, yapf),
     )
 
     result = await Get(
@@ -70,13 +70,13 @@ class DeployProcess:
                 UnionRule(DeployFieldSet, MyDeploymentFieldSet)
             ]
 
-    Use the `publish_dependencies` field to provide with a list of targets that produce packages
+    Use the `publish_dependencies` field to provide with a set of targets that produce packages
     which need to be externally published before the deployment process is executed.
     """
 
     name: str
     process: InteractiveProcess | None
-    publish_dependencies: tuple[Target, ...] = ()
+    publish_dependencies: frozenset[Target] = frozenset()
     description: str | None = None
 
 
@@ -113,36 +113,42 @@ class Deploy(Goal):
 
 
 @dataclass(frozen=True)
-class _PublishProcessesForTargetRequest:
-    target: Target
+class _PublishProcessesForTargetsRequest:
+    targets: tuple[Target, ...]
 
 
 @rule
-async def publish_process_for_target(
-    request: _PublishProcessesForTargetRequest,
+async def publish_processes_for_targets(
+    request: _PublishProcessesForTargetsRequest,
 ) -> PublishProcesses:
-    package_field_sets, publish_field_sets = await MultiGet(
-        Get(FieldSetsPerTarget, FieldSetsPerTargetRequest(PackageFieldSet, [request.target])),
-        Get(FieldSetsPerTarget, FieldSetsPerTargetRequest(PublishFieldSet, [request.target])),
+    package_field_sets_per_target, publish_field_sets_per_target = await MultiGet(
+        Get(FieldSetsPerTarget, FieldSetsPerTargetRequest(PackageFieldSet, request.targets)),
+        Get(FieldSetsPerTarget, FieldSetsPerTargetRequest(PublishFieldSet, request.targets)),
     )
 
-    return await Get(
-        PublishProcesses,
-        PublishProcessesRequest(
-            package_field_sets=package_field_sets.field_sets,
-            publish_field_sets=publish_field_sets.field_sets,
-        ),
-    )
-
-
-async def _all_publish_processes(targets: Iterable[Target]) -> PublishProcesses:
     processes_per_target = await MultiGet(
-        Get(PublishProcesses, _PublishProcessesForTargetRequest(target)) for target in targets
+        Get(
+            PublishProcesses,
+            PublishProcessesRequest(
+                package_field_sets=package_field_sets,
+                publish_field_sets=publish_field_sets,
+            ),
+        )
+        for package_field_sets, publish_field_sets in zip(
+            package_field_sets_per_target.collection, publish_field_sets_per_target.collection
+        )
     )
 
     return PublishProcesses(chain.from_iterable(processes_per_target))
 
 
+async def _all_publish_processes(targets: Iterable[Target]) -> PublishProcesses:
+    # Deduplicate and sort the targets, so that the engine memoizes the same request for the same
+    # publish dependencies, no matter how many deploys share them or in what order they list them.
+    unique_targets = sorted(set(targets), key=lambda tgt: tgt.address)
+    return await Get(PublishProcesses, _PublishProcessesForTargetsRequest(tuple(unique_targets)))
+
+
 async def _invoke_process(
     console: Console,
     process: InteractiveProcess | None,
@@ -199,7 +205,7 @@ async def run_deploy(console: Console, deploy_subsystem: DeploySubsystem) -> Dep
     )
 
     publish_targets = (
-        set(chain.from_iterable([deploy.publish_dependencies for deploy in deploy_processes]))
+        set().union(*(deploy.publish_dependencies for deploy in deploy_processes))
         if deploy_subsystem.publish_dependencies
         else set()
     )
@@ -241,13 +247,11 @@ async def run_deploy(console: Console, deploy_subsystem: DeploySubsystem) -> Dep
             exit_code = ec if ec != 0 else exit_code
             results.extend(statuses)
 
-    console.print_stderr("")
     if not results:
         sigil = console.sigil_skipped()
-        console.print_stderr(f"{sigil} Nothing deployed.")
+        results.append(f"{sigil} Nothing deployed.")
 
-    for line in results:
-        console.print_stderr(line)
+    console.print_stderr("\n" + "\n".join(results))
 
     return Deploy(exit_code)
 
@@ -126,13 +126,13 @@ async def mock_publish(request: MockPublishRequest) -> PublishProcesses:
 @rule
 async def mock_deploy(field_set: MockDeployFieldSet) -> DeployProcess:
     if not field_set.destination.value:
-        return DeployProcess(name="test-deploy", publish_dependencies=(), process=None)
+        return DeployProcess(name="test-deploy", publish_dependencies=frozenset(), process=None)
 
     dependencies = await Get(Targets, DependenciesRequest(field_set.dependencies))
     dest = field_set.destination.value
     return DeployProcess(
         name="test-deploy",
-        publish_dependencies=tuple(dependencies),
+        publish_dependencies=frozenset(dependencies),
         description="(requested)" if dest == "skip" else None,
         process=None
         if dest == "skip"
@@ -3,6 +3,7 @@
 
 from collections import defaultdict
 from dataclasses import dataclass
+from typing import Iterable
 
 from pants.core.util_rules.source_files import SourceFiles
 from pants.core.util_rules.source_files import rules as source_files_rules
@@ -31,6 +32,11 @@ class StrippedSourceFiles:
     snapshot: Snapshot
 
 
+async def _strip_source_root(digest: Digest, files: Iterable[str], source_root: str) -> Digest:
+    subset_digest = await Get(Digest, DigestSubset(digest, PathGlobs(files)))
+    return await Get(Digest, RemovePrefix(subset_digest, source_root))
+
+
 @rule
 async def strip_source_roots(source_files: SourceFiles) -> StrippedSourceFiles:
     """Removes source roots from a snapshot.
@@ -41,39 +47,45 @@ async def strip_source_roots(source_files: SourceFiles) -> StrippedSourceFiles:
         return StrippedSourceFiles(source_files.snapshot)
 
     if source_files.unrooted_files:
-        rooted_files = set(source_files.snapshot.files) - set(source_files.unrooted_files)
-        rooted_files_snapshot = await Get(
-            Snapshot, DigestSubset(source_files.snapshot.digest, PathGlobs(rooted_files))
-        )
+        unrooted_files = set(source_files.unrooted_files)
+        rooted_files = tuple(f for f in source_files.snapshot.files if f not in unrooted_files)
+        if not rooted_files:
+            # All of the files are unrooted, and so are kept unchanged.
+            return StrippedSourceFiles(source_files.snapshot)
     else:
-        rooted_files_snapshot = source_files.snapshot
+        rooted_files = source_files.snapshot.files
 
     source_roots_result = await Get(
         SourceRootsResult,
         SourceRootsRequest,
-        SourceRootsRequest.for_files(rooted_files_snapshot.files),
+        SourceRootsRequest.for_files(rooted_files),
     )
 
-    source_roots_to_files = defaultdict(set)
+    # NB: The paths in `path_to_root` are unique, so there is no need to deduplicate them.
+    source_roots_to_files = defaultdict(list)
     for f, root in source_roots_result.path_to_root.items():
-        source_roots_to_files[root.path].add(str(f))
+        source_roots_to_files[root.path].append(str(f))
+
+    if source_roots_to_files.keys() == {"."}:
+        # There is nothing to strip, and the unrooted files would be added back in unchanged.
+        return StrippedSourceFiles(source_files.snapshot)
+
+    if source_files.unrooted_files:
+        rooted_files_snapshot = await Get(
+            Snapshot, DigestSubset(source_files.snapshot.digest, PathGlobs(rooted_files))
+        )
+    else:
+        rooted_files_snapshot = source_files.snapshot
 
     if len(source_roots_to_files) == 1:
         source_root = next(iter(source_roots_to_files.keys()))
-        if source_root == ".":
-            resulting_snapshot = rooted_files_snapshot
-        else:
-            resulting_snapshot = await Get(
-                Snapshot, RemovePrefix(rooted_files_snapshot.digest, source_root)
-            )
-    else:
-        digest_subsets = await MultiGet(
-            Get(Digest, DigestSubset(rooted_files_snapshot.digest, PathGlobs(files)))
-            for files in source_roots_to_files.values()
+        resulting_snapshot = await Get(
+            Snapshot, RemovePrefix(rooted_files_snapshot.digest, source_root)
         )
+    else:
         resulting_digests = await MultiGet(
-            Get(Digest, RemovePrefix(digest, source_root))
-            for digest, source_root in zip(digest_subsets, source_roots_to_files.keys())
+            _strip_source_root(rooted_files_snapshot.digest, files, source_root)
+            for source_root, files in source_roots_to_files.items()
         )
         resulting_snapshot = await Get(Snapshot, MergeDigests(resulting_digests))
 
@@ -61,9 +61,10 @@ def test_strip_snapshot(rule_runner: RuleRunner) -> None:
         paths: list[str],
         *,
         source_root_patterns: Sequence[str] = ("src/python", "src/java", "tests/python"),
+        unrooted_files: Sequence[str] = (),
     ) -> list[str]:
         input_snapshot = rule_runner.make_snapshot_of_empty_files(paths)
-        request = SourceFiles(input_snapshot, ())
+        request = SourceFiles(input_snapshot, tuple(unrooted_files))
         return get_stripped_files(rule_runner, request, source_root_patterns=source_root_patterns)
 
     # Normal source roots
@@ -106,6 +107,22 @@ def test_strip_snapshot(rule_runner: RuleRunner) -> None:
         ["dir1/f.py", "dir2/f.py"], source_root_patterns=["/"]
     ) == ["dir1/f.py", "dir2/f.py"]
 
+    # Unrooted files are added back in unchanged.
+    assert get_stripped_files_for_snapshot(
+        ["src/python/project/example.py", "no-source-root/example.txt"],
+        unrooted_files=["no-source-root/example.txt"],
+    ) == ["no-source-root/example.txt", "project/example.py"]
+
+    assert get_stripped_files_for_snapshot(
+        ["project/f1.py", "no-source-root/example.txt"],
+        source_root_patterns=["/"],
+        unrooted_files=["no-source-root/example.txt"],
+    ) == ["no-source-root/example.txt", "project/f1.py"]
+
+    assert get_stripped_files_for_snapshot(
+        ["no-source-root/example.txt"], unrooted_files=["no-source-root/example.txt"]
+    ) == ["no-source-root/example.txt"]
+
     # Gracefully handle an empty snapshot
     assert get_stripped_files(rule_runner, SourceFiles(EMPTY_SNAPSHOT, ())) == []
 
@@ -12,7 +12,7 @@ from pants.core.target_types import FileSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import UnparsedAddressInputs
 from pants.engine.fs import DigestSubset, PathGlobs
-from pants.engine.internals.native_engine import Digest, Snapshot
+from pants.engine.internals.native_engine import Snapshot
 from pants.engine.internals.selectors import Get
 from pants.engine.rules import Rule, collect_rules, rule
 from pants.engine.target import (
@@ -65,7 +65,7 @@ class WrapSourceOutputsField(StringSequenceField):
 
 async def _wrap_source(wrapper: GenerateSourcesRequest) -> GeneratedSources:
     request = wrapper.protocol_target
-    default_extensions = {i for i in (wrapper.output.expected_file_extensions or ()) if i}
+    default_extensions = tuple(i for i in (wrapper.output.expected_file_extensions or ()) if i)
 
     inputs = await Get(
         Targets,
@@ -81,20 +81,21 @@ async def _wrap_source(wrapper: GenerateSourcesRequest) -> GeneratedSources:
             enable_codegen=True,
         ),
     )
+    if not sources.files:
+        return GeneratedSources(sources.snapshot)
 
     outputs_value: Iterable[str] | None = request.get(WrapSourceOutputsField).value
     if outputs_value:
         pass
     elif default_extensions:
-        outputs_value = [i for i in sources.files if any(i.endswith(j) for j in default_extensions)]
+        outputs_value = [i for i in sources.files if i.endswith(default_extensions)]
+        if len(outputs_value) == len(sources.files):
+            # All of the files matched, so there is nothing to filter out.
+            return GeneratedSources(sources.snapshot)
     else:
-        outputs_value = sources.files
+        return GeneratedSources(sources.snapshot)
 
-    filter_digest = await Get(
-        Digest, DigestSubset(sources.snapshot.digest, PathGlobs(outputs_value))
-    )
-
-    snapshot = await Get(Snapshot, Digest, filter_digest)
+    snapshot = await Get(Snapshot, DigestSubset(sources.snapshot.digest, PathGlobs(outputs_value)))
     return GeneratedSources(snapshot)
 
 
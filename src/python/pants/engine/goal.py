@@ -168,6 +168,11 @@ class LineOriented(Outputting):
         help="String to use to separate lines in line-oriented output.",
     )
 
+    @final
+    def unescaped_sep(self) -> str:
+        """The line separator, with escape sequences such as `\\n` interpreted."""
+        return self.sep.encode().decode("unicode_escape")
+
     @final
     @contextmanager
     def line_oriented(self, console: Console) -> Iterator[Callable[[str], None]]:
@@ -175,7 +180,7 @@ class LineOriented(Outputting):
 
         The passed options instance will generally be the `Goal.Options` of an `Outputting` `Goal`.
         """
-        sep = self.sep.encode().decode("unicode_escape")
+        sep = self.unescaped_sep()
         with self.output_sink(console) as output_sink:
             yield lambda msg: print(msg, file=output_sink, end=sep)
 
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Mapping
 
 from pants.util.frozendict import FrozenDict
 
@@ -13,9 +14,13 @@ class NativeParsedPythonDependencies:
     imports: FrozenDict[str, tuple[int, bool]]
     string_candidates: FrozenDict[str, int]
 
-    def __init__(self, imports: dict[str, tuple[int, bool]], string_candidates: dict[str, int]):
-        object.__setattr__(self, "imports", FrozenDict(imports))
-        object.__setattr__(self, "string_candidates", FrozenDict(string_candidates))
+    def __init__(
+        self,
+        imports: Mapping[str, tuple[int, bool]],
+        string_candidates: Mapping[str, int],
+    ):
+        object.__setattr__(self, "imports", FrozenDict.frozen(imports))
+        object.__setattr__(self, "string_candidates", FrozenDict.frozen(string_candidates))
 
 
 @dataclass(frozen=True)
@@ -16,6 +16,7 @@ from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, GenerateJvmToolLockfileSentinel
 from pants.util.logging import LogLevel
+from pants.util.memo import memoized
 from pants.util.ordered_set import FrozenOrderedSet
 
 _STRIP_JAR_BASENAME = "StripJar.java"
@@ -93,6 +94,7 @@ async def strip_jar(
     return await Get(Digest, RemovePrefix(process_result.output_digest, _OUTPUT_PATH))
 
 
+@memoized
 def _load_strip_jar_source() -> bytes:
     return pkg_resources.resource_string(__name__, _STRIP_JAR_BASENAME)
 
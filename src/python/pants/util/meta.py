@@ -1,8 +1,9 @@
 # Copyright 2015 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Optional, Type, TypeVar, Union, overload
 
 T = TypeVar("T")
 C = TypeVar("C", bound=Type)
@@ -10,7 +11,8 @@ C = TypeVar("C", bound=Type)
 
 class SingletonMetaclass(type):
     """When using this metaclass in your class definition, your class becomes a singleton. That is,
-    every construction returns the same instance.
+    every construction returns the same instance. Since the instance is shared, it must be
+    constructed without arguments.
 
     Example class definition:
 
@@ -18,41 +20,71 @@ class SingletonMetaclass(type):
         pass
     """
 
-    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+    def __call__(cls) -> Any:
         # TODO: convert this into an `@memoized_classproperty`!
-        if not hasattr(cls, "instance"):
-            cls.instance = super().__call__(*args, **kwargs)
-        return cls.instance
+        # NB: The instance exists on every call but the first, so read it with a single lookup
+        # rather than checking for it first with `hasattr`.
+        instance = getattr(cls, "instance", None)
+        if instance is None:
+            instance = super().__call__()
+            cls.instance = instance
+        return instance
+
+
+def _abstract_classproperty_message(func_name: str, type_name: str) -> str:
+    return """\
+The classproperty '{func_name}' in type '{type_name}' was an abstractproperty, meaning that type \
+{type_name} must override it by setting it as a variable in the class body or defining a method \
+with an @classproperty decorator.""".format(
+        func_name=func_name, type_name=type_name
+    )
 
 
 class _ClassPropertyDescriptor:
-    """Define a readable attribute on a class, given a function."""
+    # Define a readable attribute on a class, given a function.
+    #
+    # NB: This is a comment rather than a docstring because `__doc__` is a slot, which holds the
+    # docstring of the wrapped function.
+    __slots__ = ("fget", "__doc__", "_func", "_pass_cls", "_is_abstract", "_eager")
 
     # The current solution is preferred as it doesn't require any modifications to the class
     # definition beyond declaring a @classproperty.  It seems overriding __set__ and __delete__ would
     # require defining a metaclass or overriding __setattr__/__delattr__ (see
     # https://stackoverflow.com/questions/5189699/how-to-make-a-class-property).
-    def __init__(self, fget: Union[classmethod, staticmethod], doc: Optional[str]) -> None:
+    def __init__(
+        self,
+        fget: Union[classmethod, staticmethod],
+        doc: Optional[str],
+        eager: bool = False,
+    ) -> None:
         self.fget = fget
         self.__doc__ = doc
+        # Call the wrapped function directly on access rather than binding `fget` to the class first.
+        self._func = fget.__func__
+        self._pass_cls = isinstance(fget, classmethod)
+        # The wrapped function may be an abstract property, which must not be called.
+        self._is_abstract = getattr(self._func, "__isabstractmethod__", False)
+        self._eager = eager
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if self._eager:
+            # Replace this descriptor with its value for the owner, making reads plain attribute
+            # loads.
+            setattr(owner, name, self.__get__(None, owner))
 
     # See https://docs.python.org/3/howto/descriptor.html for more details.
     def __get__(self, obj: T, objtype: Optional[Type[T]] = None) -> Any:
         if objtype is None:
             objtype = type(obj)
-            # Get the callable field for this object, which may be a property.
-        callable_field = self.fget.__get__(obj, objtype)
-        if getattr(self.fget.__func__, "__isabstractmethod__", False):
-            field_name = self.fget.__func__.fget.__name__  # type: ignore[attr-defined]
-            raise TypeError(
-                """\
-The classproperty '{func_name}' in type '{type_name}' was an abstractproperty, meaning that type \
-{type_name} must override it by setting it as a variable in the class body or defining a method \
-with an @classproperty decorator.""".format(
-                    func_name=field_name, type_name=objtype.__name__
-                )
-            )
-        return callable_field()
+        if self._is_abstract:
+            field_name = self._func.fget.__name__  # type: ignore[attr-defined]
+            raise TypeError(_abstract_classproperty_message(field_name, objtype.__name__))
+        return self._func(objtype) if self._pass_cls else self._func()
+
+
+@classmethod  # type: ignore[misc]
+def _ignore_subscript(cls, item):
+    return cls
 
 
 def runtime_ignore_subscripts(cls: C) -> C:
@@ -73,16 +105,21 @@ def runtime_ignore_subscripts(cls: C) -> C:
     True
     """
 
-    @classmethod  # type: ignore[misc]
-    def __class_getitem__(cls, item):
-        return cls
-
-    cls.__class_getitem__ = __class_getitem__
-
+    cls.__class_getitem__ = _ignore_subscript
     return cls
 
 
+@overload
 def classproperty(func: Callable[..., T]) -> T:
+    ...
+
+
+@overload
+def classproperty(*, eager: bool = ...) -> Callable[[Callable[..., T]], T]:
+    ...
+
+
+def classproperty(func: Optional[Callable[..., T]] = None, *, eager: bool = False) -> T:
     """Use as a decorator on a method definition to make it a class-level attribute.
 
     This decorator can be applied to a method, a classmethod, or a staticmethod. This decorator will
@@ -101,7 +138,14 @@ def classproperty(func: Callable[..., T]) -> T:
 
     The docstring of the classproperty `x` for a class `C` can be obtained by
     `C.__dict__['x'].__doc__`.
+
+    Pass `eager=True` (i.e. `@classproperty(eager=True)`) to compute the value once, when the
+    declaring class is created, and replace the classproperty with that value. Subclasses inherit the
+    declaring class's value rather than computing their own, and the docstring is not retained.
     """
+    if func is None:
+        return functools.partial(classproperty, eager=eager)  # type: ignore[return-value]
+
     doc = func.__doc__
 
     if not isinstance(func, (classmethod, staticmethod)):
@@ -112,7 +156,10 @@ def classproperty(func: Callable[..., T]) -> T:
 
     # If we properly annotated this function as returning a _ClassPropertyDescriptor, then MyPy would
     # no longer work correctly at call sites for this decorator.
-    return _ClassPropertyDescriptor(func, doc)  # type: ignore[arg-type, return-value]
+    return _ClassPropertyDescriptor(func, doc, eager)  # type: ignore[arg-type, return-value]
+
+
+_SENTINEL_ATTR = "_decorated_type_checkable_type"
 
 
 class _ClassDecoratorWithSentinelAttribute(ABC):
@@ -126,7 +173,9 @@ class _ClassDecoratorWithSentinelAttribute(ABC):
         ...
 
     def define_instance_of(self, obj: Type, **kwargs) -> Type:
-        return type(obj.__name__, (obj,), {"_decorated_type_checkable_type": type(self), **kwargs})
+        return type(obj.__name__, (obj,), {_SENTINEL_ATTR: type(self), **kwargs})
 
     def is_instance(self, obj: Type) -> bool:
-        return getattr(obj, "_decorated_type_checkable_type", None) is type(self)
+        # NB: This deliberately uses `getattr` rather than probing `obj.__dict__`, so that subclasses
+        # of a decorated type are also considered instances.
+        return getattr(obj, _SENTINEL_ATTR, None) is type(self)
@@ -15,6 +15,9 @@ def test_singleton() -> None:
 
     assert One() is One()
 
+    with pytest.raises(TypeError):
+        One(1)  # type: ignore[call-arg]
+
 
 class WithProp:
     _value = "val0"
@@ -139,6 +142,20 @@ def test_modify_class_value() -> None:
     assert "z1" == WithFieldToModify.class_property
 
 
+def test_eager_classproperty() -> None:
+    class Eager:
+        @classproperty(eager=True)
+        def class_property(cls):
+            return cls.__name__
+
+    class EagerSubclass(Eager):
+        pass
+
+    assert "Eager" == Eager.__dict__["class_property"]
+    assert "Eager" == Eager.class_property
+    assert "Eager" == EagerSubclass.class_property
+
+
 def test_set_attr():
     class SetValue:
         _x = "x0"